@@ -1,6 +1,9 @@
 import psycopg
+from psycopg.types.json import Json
 import traceback
 import sys
+import os
+import shutil
 import sqlite3
 from rich.console import Console
 from rich.progress import Progress, TextColumn, BarColumn, SpinnerColumn
@@ -8,14 +11,50 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, IntPrompt, Confirm
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, Iterator, List, Sequence, Set, Tuple, Any, Optional
 import asyncio
 from contextlib import asynccontextmanager
 
+# orjson is an optional speedup for validating JSON columns
+try:
+    from orjson import loads as json_loads, JSONDecodeError
+except ImportError:
+    from json import loads as json_loads, JSONDecodeError
+
 console = Console()
 
 # Configuration
 MAX_RETRIES = 3
+MAX_PARALLEL_TABLES = min(8, os.cpu_count() or 1)
+SQLITE_CLI = shutil.which('sqlite3')
+# maintenance_work_mem for rebuilding indexes after a load; several tables may rebuild at once
+INDEX_BUILD_MEMORY = '256MB'
+# Automatic batch sizing aims for roughly this much row data per batch
+BATCH_TARGET_BYTES = 4 * 1024 * 1024
+MIN_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 5000
+
+# PostgreSQL column types whose values can be streamed with binary COPY.
+# Tables using any other type fall back to text COPY.
+BINARY_COPY_TYPES = {
+    'smallint', 'integer', 'bigint', 'real', 'double precision', 'boolean',
+    'text', 'character varying', 'json', 'jsonb', 'bytea'
+}
+
+# Errors raised when the target relation can't be loaded with COPY at all
+COPY_UNSUPPORTED_ERRORS = (psycopg.errors.FeatureNotSupported, psycopg.errors.WrongObjectType)
+
+# Exclusive magnitude limits of the integer column types. Binary COPY wraps
+# values that don't fit instead of rejecting them, so they're checked first.
+INTEGER_LIMITS = {'smallint': 2 ** 15, 'integer': 2 ** 31, 'bigint': 2 ** 63}
+FLOAT_TYPES = {'real', 'double precision'}
+REAL_MAX = 3.4028234663852886e38
+
+# Column types whose CSV rendering by the sqlite3 CLI round-trips exactly.
+# REAL is printed with 15 significant digits and BLOBs stop at the first NUL,
+# so tables with those go through Python instead.
+SQLITE_CLI_TEXT_TYPES = {'text', 'character varying', 'json', 'jsonb'}
+SQLITE_CLI_COPY_TYPES = SQLITE_CLI_TEXT_TYPES | {'smallint', 'integer', 'bigint', 'boolean'}
 
 def get_sqlite_config() -> Path:
     """Interactive configuration for SQLite database path"""
@@ -93,44 +132,79 @@ def check_postgres_tables_exist(config: Dict[str, Any]) -> Tuple[bool, List[str]
         return False, [f"Error checking tables: {str(e)}"]
 
 def get_pg_config() -> Dict[str, Any]:
-    """Interactive configuration for PostgreSQL connection"""
+    """Interactive configuration for PostgreSQL connection.
+
+    Fields set through the standard libpq environment variables (PGHOST, PGPORT,
+    PGDATABASE, PGUSER, PGPASSWORD) aren't prompted for on the first try. When all
+    of them are set the settings are used without asking for confirmation.
+    """
+    env_port = os.environ.get('PGPORT', '')
+    env_config = {
+        'host': os.environ.get('PGHOST'),
+        'port': int(env_port) if env_port.isdigit() else None,
+        'dbname': os.environ.get('PGDATABASE'),
+        'user': os.environ.get('PGUSER'),
+    }
+    env_password = os.environ.get('PGPASSWORD')
+
+    # Default values
+    defaults = {
+        'host': env_config['host'] or 'localhost',
+        'port': env_config['port'] or 5432,
+        'dbname': env_config['dbname'] or 'postgres',
+        'user': env_config['user'] or 'postgres',
+    }
+
     while True:
         console.print(Panel("PostgreSQL Connection Configuration", style="cyan"))
 
         config = {}
+        from_env = env_password is not None and all(value is not None for value in env_config.values())
 
-        # Default values
-        defaults = {
-            'host': 'localhost',
-            'port': 5432,
-            'dbname': 'postgres',
-            'user': 'postgres',
-        }
-
-        config['host'] = Prompt.ask(
-            "[cyan]PostgreSQL host[/]",
-            default=defaults['host']
-        )
-
-        config['port'] = IntPrompt.ask(
-            "[cyan]PostgreSQL port[/]",
-            default=defaults['port']
-        )
-
-        config['dbname'] = Prompt.ask(
-            "[cyan]Database name[/]",
-            default=defaults['dbname']
-        )
-
-        config['user'] = Prompt.ask(
-            "[cyan]Username[/]",
-            default=defaults['user']
-        )
-
-        config['password'] = Prompt.ask(
-            "[cyan]Password[/]",
-            password=True
-        )
+        if env_config['host'] is not None:
+            console.print(f"[cyan]PostgreSQL host:[/] {env_config['host']} (from PGHOST)")
+            config['host'] = env_config['host']
+        else:
+            config['host'] = Prompt.ask(
+                "[cyan]PostgreSQL host[/]",
+                default=defaults['host']
+            )
+
+        if env_config['port'] is not None:
+            console.print(f"[cyan]PostgreSQL port:[/] {env_config['port']} (from PGPORT)")
+            config['port'] = env_config['port']
+        else:
+            config['port'] = IntPrompt.ask(
+                "[cyan]PostgreSQL port[/]",
+                default=defaults['port']
+            )
+
+        if env_config['dbname'] is not None:
+            console.print(f"[cyan]Database name:[/] {env_config['dbname']} (from PGDATABASE)")
+            config['dbname'] = env_config['dbname']
+        else:
+            config['dbname'] = Prompt.ask(
+                "[cyan]Database name[/]",
+                default=defaults['dbname']
+            )
+
+        if env_config['user'] is not None:
+            console.print(f"[cyan]Username:[/] {env_config['user']} (from PGUSER)")
+            config['user'] = env_config['user']
+        else:
+            config['user'] = Prompt.ask(
+                "[cyan]Username[/]",
+                default=defaults['user']
+            )
+
+        if env_password is not None:
+            console.print("[cyan]Password:[/] (from PGPASSWORD)")
+            config['password'] = env_password
+        else:
+            config['password'] = Prompt.ask(
+                "[cyan]Password[/]",
+                password=True
+            )
 
         # Show summary
         summary = Table(show_header=False, box=None)
@@ -148,6 +222,9 @@ def get_pg_config() -> Dict[str, Any]:
 
         if not success:
             console.print(f"\n[red]Connection Error: {error_msg}[/]")
+            # Prompt for every field next time, offering the environment values as defaults
+            env_config = dict.fromkeys(env_config)
+            env_password = None
 
             if not Confirm.ask("\n[yellow]Would you like to try again?[/]"):
                 console.print("[red]Migration cancelled by user[/]")
@@ -171,6 +248,9 @@ def get_pg_config() -> Dict[str, Any]:
             console.print("3. Stop Open WebUI after confirming tables are created")
             console.print("4. Then run this migration script")
 
+            # Nobody is there to confirm a re-check when everything came from the environment
+            if from_env:
+                sys.exit(1)
             if not Confirm.ask("\n[yellow]Have you completed these steps and want to check again?[/]"):
                 console.print("[red]Migration cancelled. Please bootstrap PostgreSQL database first.[/]")
                 sys.exit(0)
@@ -179,10 +259,12 @@ def get_pg_config() -> Dict[str, Any]:
 
         console.print("\n[green]✓ PostgreSQL database has been properly bootstrapped![/]")
 
-        if not Confirm.ask("\n[yellow]Proceed with these settings?[/]"):
+        if not from_env and not Confirm.ask("\n[yellow]Proceed with these settings?[/]"):
             if not Confirm.ask("[yellow]Would you like to try different settings?[/]"):
                 console.print("[red]Migration cancelled by user[/]")
                 sys.exit(0)
+            env_config = dict.fromkeys(env_config)
+            env_password = None
             console.print("\n")  # Add spacing before retry
             continue
 
@@ -194,16 +276,17 @@ def get_batch_config() -> int:
 
     console.print("[cyan]The batch size determines how many records are processed at once.[/]")
     console.print("[cyan]A larger batch size may be faster but uses more memory.[/]")
+    console.print("[cyan]Enter 0 to size batches automatically from each table's row width.[/]")
     console.print("[cyan]Recommended range: 100-5000[/]\n")
 
     while True:
         batch_size = IntPrompt.ask(
-            "[cyan]Batch size[/]",
-            default=500
+            "[cyan]Batch size (0 = automatic)[/]",
+            default=0
         )
 
-        if batch_size < 1:
-            console.print("[red]Batch size must be at least 1[/]")
+        if batch_size < 0:
+            console.print("[red]Batch size must be 0 or more[/]")
             continue
 
         if batch_size > 10000:
@@ -273,9 +356,198 @@ def get_sqlite_safe_identifier(identifier: str) -> str:
     return f'"{identifier}"'
 
 def get_pg_safe_identifier(identifier: str) -> str:
-    """Quotes identifiers for PostgreSQL if they're reserved words"""
-    reserved_keywords = {'user', 'group', 'order', 'table', 'select', 'where', 'from', 'index', 'constraint'}
-    return f'"{identifier}"' if identifier.lower() in reserved_keywords else identifier
+    """Quotes identifiers for PostgreSQL so reserved words and mixed case keep their exact name"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+def fetch_sqlite_value(sqlite_cursor: sqlite3.Cursor, query: str) -> Any:
+    """Run a SQLite query and return the first column of its first row"""
+    sqlite_cursor.execute(query)
+    return sqlite_cursor.fetchone()[0]
+
+def estimate_row_count(table_name: str, sqlite_cursor: sqlite3.Cursor) -> int:
+    """Estimate a table's row count for progress reporting without scanning it.
+
+    The largest rowid is a single b-tree lookup and never less than the row
+    count. WITHOUT ROWID tables use the count ANALYZE left in sqlite_stat1, and
+    are only counted when there is none.
+    """
+    sqlite_safe_table_name = get_sqlite_safe_identifier(table_name)
+    try:
+        sqlite_cursor.execute(f"SELECT MAX(_rowid_) FROM {sqlite_safe_table_name}")
+        return sqlite_cursor.fetchone()[0] or 0
+    except sqlite3.OperationalError:
+        pass
+
+    try:
+        sqlite_cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1", (table_name,))
+        stat = sqlite_cursor.fetchone()
+    except sqlite3.OperationalError:
+        stat = None
+    if stat and stat[0] and stat[0].split()[0].isdigit():
+        return int(stat[0].split()[0])
+
+    sqlite_cursor.execute(f"SELECT COUNT(*) FROM {sqlite_safe_table_name}")
+    return sqlite_cursor.fetchone()[0] or 0
+
+def estimate_batch_size(table_name: str, schema: List[Tuple[Any, ...]], sqlite_cursor: sqlite3.Cursor) -> int:
+    """Pick a batch size that keeps about BATCH_TARGET_BYTES of row data per batch.
+
+    The row width is averaged over the first rows of the table, so narrow tables
+    get large batches and tables full of chat JSON get small ones.
+    """
+    column_sizes = ' + '.join(
+        f"coalesce(length(CAST({get_sqlite_safe_identifier(col[1])} AS BLOB)), 0)" for col in schema
+    )
+    sqlite_cursor.execute(f"""
+        SELECT avg({column_sizes})
+        FROM (SELECT * FROM {get_sqlite_safe_identifier(table_name)} LIMIT {MIN_BATCH_SIZE})
+    """)
+    row_bytes = sqlite_cursor.fetchone()[0] or 1
+    return max(MIN_BATCH_SIZE, min(MAX_BATCH_SIZE, int(BATCH_TARGET_BYTES // max(row_bytes, 1))))
+
+def get_value_converter(
+    column_name: str,
+    pg_type: Optional[str],
+    validate_json: bool = False
+) -> Callable[[Any], Any]:
+    """Return the function that turns a SQLite value into what COPY expects for the column.
+
+    SQLite lets any column hold any storage class, so every converter hands
+    back the Python type binary COPY expects for the column, and raises
+    ValueError for values PostgreSQL would reject anyway. jsonb values are only
+    parsed in Python when validate_json is set; otherwise PostgreSQL checks them.
+    """
+    if pg_type in INTEGER_LIMITS:
+        limit = INTEGER_LIMITS[pg_type]
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return None
+            if type(value) is not int:
+                if isinstance(value, float) and not value.is_integer():
+                    raise ValueError(f"{value!r} in {column_name} is not an integer")
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{value!r} in {column_name} is not an integer") from None
+            if not -limit <= value < limit:
+                raise ValueError(f"{value} in {column_name} is out of range for {pg_type}")
+            return value
+    elif pg_type in FLOAT_TYPES:
+        check_range = pg_type == 'real'
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return None
+            if type(value) is not float:
+                try:
+                    value = float(value)
+                except OverflowError:
+                    raise ValueError(f"{value} in {column_name} is out of range for {pg_type}") from None
+                except (TypeError, ValueError):
+                    raise ValueError(f"{value!r} in {column_name} is not a number") from None
+            if check_range and abs(value) > REAL_MAX and value != float('inf'):
+                raise ValueError(f"{value} in {column_name} is out of range for {pg_type}")
+            return value
+    elif pg_type == 'boolean':
+        def convert(value: Any) -> Any:
+            return None if value is None else value == 1
+    elif pg_type in ('json', 'jsonb'):
+        validate = validate_json and pg_type == 'jsonb'
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return None
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', errors='replace')
+            if validate and isinstance(value, str):
+                try:
+                    # Try to parse as JSON to validate
+                    json_loads(value)
+                except JSONDecodeError as e:
+                    console.print(f"[yellow]Warning: Invalid JSON in {column_name}: {e}[/]")
+                    value = '{}'
+            # JSON text is sent as-is; the wrapper only tells psycopg to use the
+            # JSON dumpers instead of re-serializing it
+            return Json(value, dumps=str)
+    elif pg_type == 'bytea':
+        def convert(value: Any) -> Any:
+            # BLOBs go through untouched; binary COPY needs bytes, not text or numbers
+            if value is None or isinstance(value, bytes):
+                return value
+            return str(value).encode('utf-8')
+    else:
+        def convert(value: Any) -> Any:
+            # SQLite already hands back valid UTF-8 str; only bytes need decoding
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', errors='replace')
+            elif value is None:
+                return None
+            elif not isinstance(value, str):
+                # Integers and REALs stored in a text column go in as their text form
+                return str(value)
+            # PostgreSQL text can't hold NUL; scanning for it is far cheaper than copying
+            return value.replace('\x00', '') if '\x00' in value else value
+    return convert
+
+def get_passthrough_check(pg_type: Optional[str], name: str) -> Optional[str]:
+    """Return a Python expression that is true when the variable `name` can go to COPY as is.
+
+    Most SQLite values already have the type their column expects, so the
+    generated row converter tests for that inline and only calls the column's
+    converter for the rest. Returns None for types that always need converting.
+    """
+    if pg_type == 'bigint':
+        # Integers read from SQLite always fit in 64 bits
+        return f"type({name}) is int or {name} is None"
+    if pg_type in INTEGER_LIMITS:
+        limit = INTEGER_LIMITS[pg_type]
+        return f"type({name}) is int and {-limit} <= {name} < {limit} or {name} is None"
+    if pg_type == 'double precision':
+        return f"type({name}) is float or {name} is None"
+    if pg_type == 'real':
+        return f"type({name}) is float and -REAL_MAX <= {name} <= REAL_MAX or {name} is None"
+    if pg_type == 'bytea':
+        return f"type({name}) is bytes or {name} is None"
+    if pg_type in ('boolean', 'json', 'jsonb'):
+        return None
+    return f"type({name}) is str and NUL not in {name} or {name} is None"
+
+def build_row_converter(
+    converters: List[Callable[[Any], Any]],
+    pg_types: List[Optional[str]]
+) -> Callable[[Sequence[Any]], Tuple[Any, ...]]:
+    """Generate a single function that converts a whole row for this table's columns.
+
+    The columns are unrolled into one tuple expression, so a row costs one call
+    with no per-column loop or copying. Values that already fit their column are
+    kept without calling their converter.
+    """
+    names = [f"value_{i}" for i in range(len(converters))]
+    fields = []
+    # Only column positions, converter names and fixed limits go into the generated source
+    for i, (name, pg_type) in enumerate(zip(names, pg_types)):
+        check = get_passthrough_check(pg_type, name)
+        if check is None:
+            fields.append(f"convert_{i}({name})")
+        else:
+            fields.append(f"{name} if {check} else convert_{i}({name})")
+    namespace: Dict[str, Any] = {f"convert_{i}": convert for i, convert in enumerate(converters)}
+    namespace.update(NUL='\x00', REAL_MAX=REAL_MAX)
+    exec(
+        f"def convert_row(row):\n"
+        f"    {', '.join(names)}, = row\n"
+        f"    return ({', '.join(fields)},)\n",
+        namespace
+    )
+    return namespace['convert_row']
+
+def iter_converted_rows(
+    raw_rows: List[Tuple[Any, ...]],
+    convert_row: Callable[[Sequence[Any]], Tuple[Any, ...]]
+) -> Iterator[Tuple[Any, ...]]:
+    """Convert SQLite rows lazily so a batch is never held in memory twice"""
+    return map(convert_row, raw_rows)
 
 @asynccontextmanager
 async def async_db_connections(sqlite_path: Path, pg_config: Dict[str, Any]):
@@ -285,16 +557,22 @@ async def async_db_connections(sqlite_path: Path, pg_config: Dict[str, Any]):
     try:
         # Try SQLite connection first
         try:
-            sqlite_conn = sqlite3.connect(sqlite_path, timeout=60)
+            # Batches are read ahead on executor threads, one at a time per connection
+            sqlite_conn = sqlite3.connect(sqlite_path, timeout=60, check_same_thread=False)
             sqlite_conn.execute('PRAGMA journal_mode=WAL')
-            sqlite_conn.execute('PRAGMA synchronous=NORMAL')
+            # The source database is only ever read: memory-map it, keep a large
+            # page cache and guard against accidental writes
+            sqlite_conn.execute('PRAGMA query_only=ON')
+            sqlite_conn.execute('PRAGMA cache_size=-262144')
+            sqlite_conn.execute('PRAGMA mmap_size=30000000000')
+            sqlite_conn.execute('PRAGMA temp_store=MEMORY')
         except sqlite3.Error as e:
             console.print(f"[bold red]Failed to connect to SQLite database:[/] {str(e)}")
             raise
 
         # Try PostgreSQL connection
         try:
-            pg_conn = psycopg.connect(**pg_config)
+            pg_conn = await psycopg.AsyncConnection.connect(**pg_config)
         except psycopg.OperationalError as e:
             console.print(f"[bold red]Failed to connect to PostgreSQL database:[/] {str(e)}")
             if sqlite_conn:
@@ -312,14 +590,272 @@ async def async_db_connections(sqlite_path: Path, pg_config: Dict[str, Any]):
 
         if pg_conn:
             try:
-                pg_conn.close()
+                await pg_conn.close()
             except psycopg.Error:
                 pass
 
+async def truncate_table(table_name: str, pg_cursor: psycopg.AsyncCursor) -> None:
+    """Empty an existing PostgreSQL table before it is reloaded"""
+    pg_safe_table_name = get_pg_safe_identifier(table_name)
+    try:
+        await pg_cursor.execute(f"TRUNCATE TABLE {pg_safe_table_name} CASCADE")
+        await pg_cursor.connection.commit()
+    except psycopg.Error as e:
+        console.print(f"[yellow]Note: Table {table_name} does not exist yet or could not be truncated: {e}[/]")
+        await pg_cursor.connection.rollback()
+
+async def get_table_dependencies(pg_cursor: psycopg.AsyncCursor) -> Dict[str, Set[str]]:
+    """Map each PostgreSQL table to the tables its foreign keys reference"""
+    dependencies: Dict[str, Set[str]] = {}
+    try:
+        await pg_cursor.execute("""
+            SELECT child.relname, parent.relname
+            FROM pg_constraint con
+            JOIN pg_class child ON child.oid = con.conrelid
+            JOIN pg_class parent ON parent.oid = con.confrelid
+            JOIN pg_namespace ns ON ns.oid = child.relnamespace
+            WHERE con.contype = 'f' AND ns.nspname = 'public'
+        """)
+        for child, parent in await pg_cursor.fetchall():
+            if child != parent:
+                dependencies.setdefault(child, set()).add(parent)
+        await pg_cursor.connection.commit()
+    except psycopg.Error:
+        await pg_cursor.connection.rollback()
+    return dependencies
+
+async def get_pg_column_types(pg_cursor: psycopg.AsyncCursor) -> Dict[str, Dict[str, str]]:
+    """Fetch the column types of every PostgreSQL table in a single catalog query"""
+    column_types: Dict[str, Dict[str, str]] = {}
+    try:
+        await pg_cursor.execute("""
+            SELECT table_name, column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+        """)
+        for table_name, column_name, data_type in await pg_cursor.fetchall():
+            column_types.setdefault(table_name, {})[column_name] = data_type
+        await pg_cursor.connection.commit()
+    except psycopg.Error:
+        await pg_cursor.connection.rollback()
+    return column_types
+
+def get_sqlite_schemas(sqlite_cursor: sqlite3.Cursor) -> Dict[str, List[Tuple[Any, ...]]]:
+    """Fetch PRAGMA table_info for every SQLite table in a single query"""
+    retry_count = 0
+    while True:
+        try:
+            sqlite_cursor.execute("""
+                SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+                FROM sqlite_master m
+                JOIN pragma_table_info(m.name) p
+                WHERE m.type = 'table'
+                ORDER BY m.name, p.cid
+            """)
+            rows = sqlite_cursor.fetchall()
+            break
+        except sqlite3.DatabaseError as e:
+            retry_count += 1
+            console.print(f"[yellow]Retry {retry_count}/{MAX_RETRIES} getting SQLite schema: {e}[/]")
+            if retry_count == MAX_RETRIES:
+                raise
+
+    schemas: Dict[str, List[Tuple[Any, ...]]] = {}
+    for table_name, *column_info in rows:
+        schemas.setdefault(table_name, []).append(tuple(column_info))
+    return schemas
+
+def group_tables_by_dependencies(tables: List[str], dependencies: Dict[str, Set[str]]) -> List[List[str]]:
+    """Group tables that reference each other in a cycle and order the groups
+    so that referenced tables come before the tables pointing at them.
+
+    Tables keep their original order within a group.
+    """
+    table_set = set(tables)
+    reachable: Dict[str, Set[str]] = {}
+    for table_name in tables:
+        seen: Set[str] = set()
+        stack = [table_name]
+        while stack:
+            for parent in dependencies.get(stack.pop(), set()) & table_set:
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+        reachable[table_name] = seen
+
+    groups: List[List[str]] = []
+    grouped: Set[str] = set()
+    for table_name in tables:
+        if table_name not in grouped:
+            group = [t for t in tables if t == table_name or (
+                t in reachable[table_name] and table_name in reachable[t]
+            )]
+            groups.append(group)
+            grouped.update(group)
+
+    ordered: List[List[str]] = []
+    remaining = groups
+    while remaining:
+        pending = {t for group in remaining for t in group}
+        ready = [
+            group for group in remaining
+            if not {parent for t in group for parent in dependencies.get(t, set())} & (pending - set(group))
+        ]
+        ordered.extend(ready)
+        remaining = [group for group in remaining if group not in ready]
+    return ordered
+
+async def renew_table_storage(table_name: str, pg_cursor: psycopg.AsyncCursor) -> None:
+    """Give the already emptied table fresh storage inside the load transaction.
+
+    With wal_level=minimal PostgreSQL then writes the COPY straight to disk
+    without WAL-logging every row. Tables that other tables reference can't be
+    truncated without CASCADE and are loaded into their existing storage.
+    """
+    await pg_cursor.execute("SAVEPOINT renew_storage")
+    try:
+        await pg_cursor.execute(f"TRUNCATE TABLE ONLY {get_pg_safe_identifier(table_name)}")
+        await pg_cursor.execute("RELEASE SAVEPOINT renew_storage")
+    except psycopg.Error:
+        await pg_cursor.execute("ROLLBACK TO SAVEPOINT renew_storage")
+
+async def suspend_table_maintenance(table_name: str, pg_cursor: psycopg.AsyncCursor) -> List[str]:
+    """Drop plain secondary indexes and disable user triggers ahead of a bulk load.
+
+    Returns the statements that restore them once the data is in. Primary keys,
+    unique indexes and foreign keys stay in place so bad rows are still rejected.
+    """
+    pg_safe_table_name = get_pg_safe_identifier(table_name)
+    restore_statements: List[str] = []
+
+    await pg_cursor.execute("SAVEPOINT suspend_maintenance")
+    try:
+        await pg_cursor.execute("""
+            SELECT i.relname, pg_get_indexdef(i.oid)
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname = 'public' AND t.relname = %s
+            AND NOT x.indisunique AND NOT x.indisprimary
+            AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = x.indexrelid)
+        """, (table_name,))
+        for index_name, index_definition in await pg_cursor.fetchall():
+            await pg_cursor.execute(f"DROP INDEX public.{get_pg_safe_identifier(index_name)}")
+            restore_statements.append(index_definition)
+
+        await pg_cursor.execute("""
+            SELECT EXISTS (
+                SELECT 1
+                FROM pg_trigger tg
+                JOIN pg_class t ON t.oid = tg.tgrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                WHERE n.nspname = 'public' AND t.relname = %s AND NOT tg.tgisinternal
+            )
+        """, (table_name,))
+        if (await pg_cursor.fetchone())[0]:
+            await pg_cursor.execute(f"ALTER TABLE public.{pg_safe_table_name} DISABLE TRIGGER USER")
+            restore_statements.append(f"ALTER TABLE public.{pg_safe_table_name} ENABLE TRIGGER USER")
+
+        await pg_cursor.execute("RELEASE SAVEPOINT suspend_maintenance")
+    except psycopg.Error as e:
+        await pg_cursor.execute("ROLLBACK TO SAVEPOINT suspend_maintenance")
+        console.print(f"[yellow]Note: Could not defer index maintenance for {table_name}: {e}[/]")
+        return []
+
+    return restore_statements
+
+async def copy_table_with_sqlite_cli(
+    sqlite_path: Path,
+    table_name: str,
+    schema: List[Tuple[Any, ...]],
+    copy_types: List[Optional[str]],
+    sqlite_cursor: sqlite3.Cursor,
+    pg_cursor: psycopg.AsyncCursor
+) -> Optional[int]:
+    """Pipe the sqlite3 CLI's CSV output straight into COPY, without touching rows in Python.
+
+    Returns the number of rows copied, or None, with nothing loaded, when the
+    table can't be copied this way so the caller can fall back to the
+    in-process path.
+    """
+    if not SQLITE_CLI or not schema or pg_cursor.connection.info.encoding != 'utf-8':
+        return None
+    if not all(col_type in SQLITE_CLI_COPY_TYPES for col_type in copy_types):
+        return None
+
+    sqlite_safe_table_name = get_sqlite_safe_identifier(table_name)
+    sqlite_col_names = [get_sqlite_safe_identifier(col[1]) for col in schema]
+
+    # The CLI prints text as C strings, so a NUL silently truncates the value, and
+    # before PostgreSQL 18 an unquoted \. line ends a CSV COPY early. Check for
+    # NULs, \. sequences, BLOBs and REALs in text columns first; SQLite can do
+    # that scan far faster than Python can convert the rows.
+    text_checks = [
+        f"typeof({name}) IN ('blob', 'real') OR instr(CAST({name} AS BLOB), x'00') > 0 "
+        f"OR instr({name}, '\\.') > 0"
+        for name, col_type in zip(sqlite_col_names, copy_types)
+        if col_type in SQLITE_CLI_TEXT_TYPES
+    ]
+    if text_checks:
+        # This scans the whole table, so keep it off the event loop other tables share
+        needs_conversion = await asyncio.get_running_loop().run_in_executor(
+            None,
+            fetch_sqlite_value,
+            sqlite_cursor,
+            f"SELECT EXISTS (SELECT 1 FROM {sqlite_safe_table_name} WHERE {' OR '.join(text_checks)})"
+        )
+        if needs_conversion:
+            return None
+
+    col_names = [get_pg_safe_identifier(col[1]) for col in schema]
+    sqlite_query = f"SELECT {', '.join(sqlite_col_names)} FROM {sqlite_safe_table_name}"
+    # In CSV mode the CLI quotes empty strings and leaves NULLs bare, which is
+    # exactly how COPY's CSV format tells them apart
+    copy_query = (
+        f"COPY {get_pg_safe_identifier(table_name)} ({', '.join(col_names)}) "
+        "FROM STDIN WITH (FORMAT CSV)"
+    )
+
+    process = await asyncio.create_subprocess_exec(
+        SQLITE_CLI, '-batch', '-readonly', '-csv', str(sqlite_path), sqlite_query,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    # Drain stderr alongside stdout so a chatty sqlite3 can't block on a full pipe
+    stderr_reader = asyncio.ensure_future(process.stderr.read())
+    await pg_cursor.execute("SAVEPOINT migrate_cli")
+    try:
+        async with pg_cursor.copy(copy_query) as copy:
+            while True:
+                chunk = await process.stdout.read(65536)
+                if not chunk:
+                    break
+                await copy.write(chunk)
+            if await process.wait() != 0:
+                error = (await stderr_reader).decode('utf-8', errors='replace').strip()
+                raise RuntimeError(f"sqlite3 exited with status {process.returncode}: {error}")
+    except (psycopg.Error, RuntimeError) as e:
+        await pg_cursor.execute("ROLLBACK TO SAVEPOINT migrate_cli")
+        console.print(f"[yellow]sqlite3 CLI copy failed for {table_name}, falling back to row processing: {e}[/]")
+        return None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        await stderr_reader
+
+    copied_rows = pg_cursor.rowcount
+    await pg_cursor.execute("RELEASE SAVEPOINT migrate_cli")
+    return copied_rows
+
 async def process_table(
     table_name: str,
+    schema: List[Tuple[Any, ...]],
+    pg_column_types: Dict[str, str],
+    sqlite_path: Path,
     sqlite_cursor: sqlite3.Cursor,
-    pg_cursor: psycopg.Cursor,
+    pg_cursor: psycopg.AsyncCursor,
     progress: Progress,
     batch_size: int
 ) -> None:
@@ -338,39 +874,10 @@ async def process_table(
     )
 
     try:
-        # Truncate existing table
-        try:
-            pg_cursor.execute(f"TRUNCATE TABLE {pg_safe_table_name} CASCADE")
-            pg_cursor.connection.commit()
-        except psycopg.Error as e:
-            console.print(f"[yellow]Note: Table {table_name} does not exist yet or could not be truncated: {e}[/]")
-            pg_cursor.connection.rollback()
-
-        # Get PostgreSQL column types
-        try:
-            pg_cursor.execute("""
-                SELECT column_name, data_type
-                FROM information_schema.columns
-                WHERE table_name = %s
-            """, (table_name,))
-            pg_column_types = dict(pg_cursor.fetchall())
-            pg_cursor.connection.commit()
-        except psycopg.Error:
-            pg_cursor.connection.rollback()
-            pg_column_types = {}
-
-        # Get SQLite schema
-        retry_count = 0
-        while retry_count < MAX_RETRIES:
-            try:
-                sqlite_cursor.execute(f'PRAGMA table_info({sqlite_safe_table_name})')
-                schema = sqlite_cursor.fetchall()
-                break
-            except sqlite3.DatabaseError as e:
-                retry_count += 1
-                console.print(f"[yellow]Retry {retry_count}/{MAX_RETRIES} getting schema for {table_name}: {e}[/]")
-                if retry_count == MAX_RETRIES:
-                    raise
+        # Load the whole table in one transaction so WAL is flushed once per table,
+        # not once per batch. A crash just means re-running the table, so the
+        # commit doesn't need to wait for the flush either.
+        await pg_cursor.execute("SET LOCAL synchronous_commit = off")
 
         # Create table if it doesn't exist
         if not pg_column_types:
@@ -379,122 +886,268 @@ async def process_table(
                           for col in schema]
                 create_query = f"CREATE TABLE IF NOT EXISTS {pg_safe_table_name} ({', '.join(columns)})"
                 console.print(f"[cyan]Creating table with query:[/] {create_query}")
-                pg_cursor.execute(create_query)
-                pg_cursor.connection.commit()
+                await pg_cursor.execute(create_query)
+                pg_column_types = {col[1]: sqlite_to_pg_type(col[2], col[1]).lower() for col in schema}
             except psycopg.Error as e:
                 console.print(f"[red]Error creating table {table_name}: {e}[/]")
-                pg_cursor.connection.rollback()
+                await pg_cursor.connection.rollback()
                 raise
+        else:
+            await renew_table_storage(table_name, pg_cursor)
 
-        # Process rows
-        sqlite_cursor.execute(f"SELECT COUNT(*) FROM {sqlite_safe_table_name}")
-        total_rows = sqlite_cursor.fetchone()[0]
+        # Build secondary indexes once after the load instead of row by row
+        restore_statements = await suspend_table_maintenance(table_name, pg_cursor)
+
+        # Process rows. SQLite calls that may scan a table run on executor threads
+        # so they don't stall the other tables sharing this event loop.
+        loop = asyncio.get_running_loop()
         processed_rows = 0
+        # Track progress in rows so each batch is a cheap advance, not a recomputed percentage
+        estimated_rows = await loop.run_in_executor(None, estimate_row_count, table_name, sqlite_cursor)
+        progress.update(task_id, total=estimated_rows or 1)
         failed_rows = []
-
-        while processed_rows < total_rows:
-            try:
-                sqlite_cursor.execute(
-                    f"SELECT * FROM {sqlite_safe_table_name} LIMIT {batch_size} OFFSET {processed_rows}"
+        # Rows lost to SQLite read errors; they're neither processed nor retried
+        skipped_rows = 0
+        read_failures = 0
+        use_copy = True
+        next_batch: Optional[asyncio.Future] = None
+
+        col_names = [get_pg_safe_identifier(col[1]) for col in schema]
+        copy_types = [pg_column_types.get(col[1]) for col in schema]
+        convert_row = build_row_converter(
+            [get_value_converter(col[1], col_type) for col, col_type in zip(schema, copy_types)],
+            copy_types
+        )
+        # Rows of a rejected batch are retried with invalid jsonb replaced by '{}'
+        retry_convert_row = build_row_converter(
+            [
+                get_value_converter(col[1], col_type, validate_json=True)
+                for col, col_type in zip(schema, copy_types)
+            ],
+            copy_types
+        )
+        use_binary_copy = all(col_type in BINARY_COPY_TYPES for col_type in copy_types)
+        copy_query = f"COPY {pg_safe_table_name} ({', '.join(col_names)}) FROM STDIN"
+        insert_query = f"""
+            INSERT INTO {pg_safe_table_name}
+            ({', '.join(col_names)})
+            VALUES ({', '.join(['%s'] * len(col_names))})
+        """
+
+        copied_rows = None
+        if not is_group_table:
+            copied_rows = await copy_table_with_sqlite_cli(
+                sqlite_path, table_name, schema, copy_types, sqlite_cursor, pg_cursor
+            )
+        if copied_rows is not None:
+            processed_rows = copied_rows
+        else:
+            if not batch_size:
+                batch_size = await loop.run_in_executor(
+                    None, estimate_batch_size, table_name, schema, sqlite_cursor
                 )
-                raw_rows = sqlite_cursor.fetchall()
+            # Stream the table with a single scan; re-running LIMIT/OFFSET per batch
+            # makes SQLite walk every earlier row again and goes quadratic
+            sqlite_cursor.execute(f"SELECT * FROM {sqlite_safe_table_name}")
+            # Always keep the next batch being read from SQLite in a worker thread
+            # while the current one is streamed to PostgreSQL
+            next_batch = loop.run_in_executor(None, sqlite_cursor.fetchmany, batch_size)
+
+        def restart_scan(offset: int) -> List[Tuple[Any, ...]]:
+            """Restart the scan past rows SQLite couldn't read and fetch the next batch."""
+            sqlite_cursor.execute(f"SELECT * FROM {sqlite_safe_table_name} LIMIT -1 OFFSET {offset}")
+            return sqlite_cursor.fetchmany(batch_size)
+
+        async def copy_batch(raw_rows: List[Tuple[Any, ...]]) -> None:
+            """Stream a whole batch in a single COPY.
+
+            In binary format psycopg packs each field itself, so nothing is escaped
+            or parsed as text.
+            """
+            query = f"{copy_query} WITH (FORMAT BINARY)" if use_binary_copy else copy_query
+            async with pg_cursor.copy(query) as copy:
+                if use_binary_copy:
+                    copy.set_types(copy_types)
+                rows = iter_converted_rows(raw_rows, convert_row)
+                if is_group_table:
+                    for row_index, row in enumerate(rows):
+                        console.print(f"[cyan]Processing group row {processed_rows + skipped_rows + row_index}[/]")
+                        await copy.write_row(row)
+                else:
+                    # Keep the hot loop bare: encoding happens in psycopg's C implementation
+                    for row in rows:
+                        await copy.write_row(row)
+
+        # Read until the scan runs dry; the row estimate is only used for progress
+        try:
+            while next_batch is not None:
+                try:
+                    raw_rows = await next_batch
+                    read_failures = 0
 
-                if not raw_rows:
-                    break
+                    if not raw_rows:
+                        break
 
-                rows = []
-                for raw_row in raw_rows:
-                    cleaned_row = []
-                    for item in raw_row:
-                        if isinstance(item, bytes):
-                            try:
-                                cleaned_row.append(item.decode('utf-8', errors='replace'))
-                            except:
-                                cleaned_row.append(item.decode('latin1', errors='replace'))
-                        elif isinstance(item, str):
-                            try:
-                                cleaned_row.append(item.encode('utf-8', errors='replace').decode('utf-8'))
-                            except:
-                                cleaned_row.append(item.encode('latin1', errors='replace').decode('latin1'))
-                        else:
-                            cleaned_row.append(item)
-                    rows.append(tuple(cleaned_row))
+                    next_batch = loop.run_in_executor(None, sqlite_cursor.fetchmany, batch_size)
 
-                for row_index, row in enumerate(rows):
+                    await pg_cursor.execute("SAVEPOINT migrate_batch")
+                    batch_error: Optional[Exception] = None
                     try:
-                        if is_group_table:
-                            console.print(f"[cyan]Processing group row {processed_rows + row_index}[/]")
-                        col_names = [get_pg_safe_identifier(col[1]) for col in schema]
-                        values = []
-                        for i, value in enumerate(row):
-                            col_name = schema[i][1]
-                            col_type = pg_column_types.get(col_name)
-
-                            if value is None:
-                                values.append('NULL')
-                            elif col_type == 'boolean':
-                                values.append('true' if value == 1 else 'false')
-                            elif isinstance(value, str):
-                                # Check if this is a JSON column
-                                if col_type == 'jsonb':
-                                    try:
-                                        # Try to parse as JSON to validate
-                                        import json
-                                        json.loads(value)
-                                        values.append(f"'{value}'::jsonb")
-                                    except json.JSONDecodeError as e:
-                                        console.print(f"[yellow]Warning: Invalid JSON in {col_name}: {e}[/]")
-                                        values.append("'{}'::jsonb")
-                                else:
-                                    escaped_value = value.replace(chr(39), chr(39)*2)
-                                    escaped_value = escaped_value.replace('\x00', '')
-                                    values.append(f"'{escaped_value}'")
-                            else:
-                                values.append(str(value))
-
-                        insert_query = f"""
-                            INSERT INTO {pg_safe_table_name}
-                            ({', '.join(col_names)})
-                            VALUES ({', '.join(values)})
-                        """
-                        if is_group_table:
-                            console.print(f"[cyan]Executing query:[/]\n{insert_query}")
-                        pg_cursor.execute(insert_query)
-                    except Exception as e:
-                        if is_group_table:
-                            console.print(f"[red]Error processing group row {processed_rows + row_index}:[/]")
-                            console.print(f"[red]Row data:[/] {row}")
-                            console.print(f"[red]Error details:[/] {str(e)}")
+                        if use_copy:
+                            await copy_batch(raw_rows)
                         else:
-                            console.print(f"[red]Error processing row in {table_name}: {e}[/]")
-                        failed_rows.append((table_name, processed_rows + len(failed_rows), str(e)))
-                        continue
-
-                processed_rows += len(rows)
-                pg_cursor.connection.commit()
-                progress.update(task_id, completed=(processed_rows / total_rows) * 100)
-
-            except sqlite3.DatabaseError as e:
-                console.print(f"[red]SQLite error during batch processing: {e}[/]")
-                console.print("[yellow]Attempting to continue with next batch...[/]")
-                processed_rows += batch_size
-                continue
+                            # psycopg pipelines executemany, so the batch still goes out in one flush
+                            await pg_cursor.executemany(insert_query, iter_converted_rows(raw_rows, convert_row))
+                    except (psycopg.Error, TypeError, ValueError) as e:
+                        # TypeError and ValueError come from values that don't fit their column
+                        await pg_cursor.execute("ROLLBACK TO SAVEPOINT migrate_batch")
+                        batch_error = e
+
+                    # The converters hand binary COPY the types it expects; should psycopg's
+                    # binary dumpers still refuse a value, text COPY lets PostgreSQL parse it
+                    if use_copy and use_binary_copy and isinstance(batch_error, TypeError):
+                        console.print(f"[yellow]Binary COPY can't encode a value in {table_name}, using text COPY: {batch_error}[/]")
+                        use_binary_copy = False
+                        try:
+                            await copy_batch(raw_rows)
+                            batch_error = None
+                        except (psycopg.Error, TypeError, ValueError) as e:
+                            await pg_cursor.execute("ROLLBACK TO SAVEPOINT migrate_batch")
+                            batch_error = e
+
+                    # COPY FROM ignores rules but can't load views, or foreign and partitioned
+                    # tables with nowhere to route the rows; insert for the rest of the table
+                    if use_copy and isinstance(batch_error, COPY_UNSUPPORTED_ERRORS):
+                        console.print(f"[yellow]COPY not supported for {table_name}, using batched INSERTs: {batch_error}[/]")
+                        use_copy = False
+                        try:
+                            await pg_cursor.executemany(insert_query, iter_converted_rows(raw_rows, convert_row))
+                            batch_error = None
+                        except (psycopg.Error, TypeError, ValueError) as e:
+                            await pg_cursor.execute("ROLLBACK TO SAVEPOINT migrate_batch")
+                            batch_error = e
+
+                    if batch_error is not None:
+                        console.print(f"[yellow]Batch failed in {table_name}, retrying rows individually: {batch_error}[/]")
+
+                        # Retry row by row so a single bad row doesn't take the batch down with it
+                        for row_index, raw_row in enumerate(raw_rows):
+                            await pg_cursor.execute("SAVEPOINT migrate_row")
+                            try:
+                                # Converted inside the try so a value that doesn't fit fails only its row
+                                row = retry_convert_row(raw_row)
+                                # Prepared once per connection, then reused for every retried row
+                                await pg_cursor.execute(insert_query, row, prepare=True)
+                                await pg_cursor.execute("RELEASE SAVEPOINT migrate_row")
+                            except (psycopg.Error, TypeError, ValueError) as e:
+                                await pg_cursor.execute("ROLLBACK TO SAVEPOINT migrate_row")
+                                if is_group_table:
+                                    console.print(f"[red]Error processing group row {processed_rows + skipped_rows + row_index}:[/]")
+                                    console.print(f"[red]Row data:[/] {raw_rows[row_index]}")
+                                    console.print(f"[red]Error details:[/] {str(e)}")
+                                else:
+                                    console.print(f"[red]Error processing row in {table_name}: {e}[/]")
+                                failed_rows.append((table_name, processed_rows + skipped_rows + row_index, str(e)))
+
+                    await pg_cursor.execute("RELEASE SAVEPOINT migrate_batch")
+                    processed_rows += len(raw_rows)
+                    progress.advance(task_id, len(raw_rows))
+
+                except sqlite3.DatabaseError as e:
+                    console.print(f"[red]SQLite error during batch processing: {e}[/]")
+                    read_failures += 1
+                    read_offset = processed_rows + skipped_rows
+                    if read_failures >= MAX_RETRIES:
+                        console.print(f"[red]Giving up on the rest of {table_name} after {read_failures} read errors in a row[/]")
+                        failed_rows.append((table_name, read_offset, f"Remaining rows unreadable: {e}"))
+                        next_batch = None
+                        break
+                    console.print("[yellow]Attempting to continue with next batch...[/]")
+                    failed_rows.append((table_name, read_offset, f"Batch of up to {batch_size} rows unreadable: {e}"))
+                    skipped_rows += batch_size
+                    # The scan can't continue past the error, so restart it after the skipped batch
+                    next_batch = loop.run_in_executor(None, restart_scan, processed_rows + skipped_rows)
+                    continue
+        finally:
+            # On an error the read-ahead may still be running on the shared SQLite cursor;
+            # let it finish before the cursor is reused
+            if next_batch is not None:
+                await asyncio.wait([next_batch])
+
+        if restore_statements:
+            await pg_cursor.execute(f"SET LOCAL maintenance_work_mem = '{INDEX_BUILD_MEMORY}'")
+            for statement in restore_statements:
+                await pg_cursor.execute(statement)
+
+        await pg_cursor.connection.commit()
 
         if failed_rows:
             console.print(f"\n[yellow]Failed rows for {table_name}:[/]")
             for table, row_num, error in failed_rows:
                 console.print(f"Row {row_num}: {error}")
 
-        progress.update(task_id, completed=100)
+        progress.update(task_id, total=processed_rows or 1, completed=processed_rows or 1)
         console.print(f"[green]Completed migrating {processed_rows} rows from {table_name}[/]")
         if failed_rows:
             console.print(f"[yellow]Failed to migrate {len(failed_rows)} rows from {table_name}[/]")
 
     except Exception as e:
-        pg_cursor.connection.rollback()
+        await pg_cursor.connection.rollback()
         console.print(f"[bold red]Error processing table {table_name}:[/] {str(e)}")
         raise
 
+async def migrate_tables(
+    table_groups: List[List[str]],
+    dependencies: Dict[str, Set[str]],
+    schemas: Dict[str, List[Tuple[Any, ...]]],
+    pg_column_types: Dict[str, Dict[str, str]],
+    sqlite_path: Path,
+    pg_config: Dict[str, Any],
+    progress: Progress,
+    batch_size: int
+) -> None:
+    """Migrate tables concurrently, each worker holding its own pair of connections.
+
+    The tables of a group are migrated one after another by the same worker.
+    """
+    tables = [table_name for group in table_groups for table_name in group]
+    position = {table_name: i for i, table_name in enumerate(tables)}
+    completed = {table_name: asyncio.Event() for table_name in tables}
+    queue: asyncio.Queue = asyncio.Queue()
+    for group in table_groups:
+        queue.put_nowait(group)
+
+    async def worker() -> None:
+        async with async_db_connections(sqlite_path, pg_config) as (sqlite_conn, pg_conn):
+            sqlite_cursor = sqlite_conn.cursor()
+            pg_cursor = pg_conn.cursor()
+
+            while not queue.empty():
+                # Tables in a foreign key cycle each hold locks the others' key checks
+                # need until they commit, so loading them side by side would deadlock
+                # in PostgreSQL. They come as one group and are loaded in turn.
+                for table_name in queue.get_nowait():
+                    # Groups are queued parents first, so a table only ever waits on
+                    # tables that are already loading or done
+                    for parent in dependencies.get(table_name, set()):
+                        if parent in position and position[parent] < position[table_name]:
+                            await completed[parent].wait()
+
+                    await process_table(
+                        table_name,
+                        schemas.get(table_name, []),
+                        pg_column_types.get(table_name, {}),
+                        sqlite_path,
+                        sqlite_cursor,
+                        pg_cursor,
+                        progress,
+                        batch_size
+                    )
+                    completed[table_name].set()
+
+    worker_count = max(1, min(MAX_PARALLEL_TABLES, len(table_groups)))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+
 async def migrate() -> None:
     # Get SQLite database path
     sqlite_path = get_sqlite_config()
@@ -516,7 +1169,22 @@ async def migrate() -> None:
         pg_cursor = pg_conn.cursor()
 
         sqlite_cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = sqlite_cursor.fetchall()
+        tables = [
+            table_name for (table_name,) in sqlite_cursor.fetchall()
+            if table_name not in ("migratehistory", "alembic_version")
+        ]
+
+        # Truncate everything up front: a TRUNCATE ... CASCADE issued while the
+        # tables load in parallel could wipe a table another worker already filled
+        for table_name in tables:
+            await truncate_table(table_name, pg_cursor)
+
+        dependencies = await get_table_dependencies(pg_cursor)
+        table_groups = group_tables_by_dependencies(tables, dependencies)
+
+        # Introspect both schemas once instead of querying per table
+        schemas = get_sqlite_schemas(sqlite_cursor)
+        pg_column_types = await get_pg_column_types(pg_cursor)
 
         with Progress(
             SpinnerColumn(),
@@ -525,17 +1193,16 @@ async def migrate() -> None:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         ) as progress:
             try:
-                for (table_name,) in tables:
-                    if table_name in ("migratehistory", "alembic_version"):
-                        continue
-
-                    await process_table(
-                        table_name,
-                        sqlite_cursor,
-                        pg_cursor,
-                        progress,
-                        batch_size
-                    )
+                await migrate_tables(
+                    table_groups,
+                    dependencies,
+                    schemas,
+                    pg_column_types,
+                    sqlite_path,
+                    pg_config,
+                    progress,
+                    batch_size
+                )
 
                 console.print(Panel("Migration Complete!", style="green"))
 
@@ -543,11 +1210,17 @@ async def migrate() -> None:
                 console.print(f"[bold red]Critical error during migration:[/] {e}")
                 console.print("[red]Stack trace:[/]")
                 console.print(traceback.format_exc())
-                pg_conn.rollback()
+                await pg_conn.rollback()
                 sys.exit(1)
 
 def main():
-    asyncio.run(migrate())
+    # uvloop is an optional speedup (pip install "open-webui-postgres-migration[speedups]")
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(migrate())
+    else:
+        uvloop.run(migrate())
 
 if __name__ == "__main__":
     main()